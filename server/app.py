@@ -6,27 +6,21 @@ import tracemalloc
 import tempfile
 import zipfile
 import json
-import math
 from concurrent.futures import ThreadPoolExecutor
 import geopandas as gpd
 from flask import Flask, request, jsonify, send_file
 from flask_cors import CORS
-from simplification.utils import count_vertices, calculate_positional_error, traverse_geometries
-from simplification.douglas import douglas_peucker
-from simplification.douglas_improved import improved_douglas_peucker
-from simplification.visvalingam import visvalingam_whyatt
-from simplification.reumann import reumann_witkam
-from simplification.perpendicular_distance import pd
-from simplification.radial_distance import radial_distance
-from simplification.nth_point import nth_point
-from simplification.lang import lang
-from simplification.random import simplify_random
+from simplification.utils import count_vertices, calculate_positional_error
+from simplification.registry import TRAVERSAL_ALGORITHMS, DIRECT_ALGORITHMS, simplify
+from simplification.scheduler import ParallelTraversal
 
 
 app = Flask(__name__)
 cors = CORS(app, origins="*")
 
 ZIP_FOLDER = "./samples"
+# Warm-pool break-even is about 120 vertices, this also keeps tiny layers off the cold start
+PARALLEL_VERTEX_THRESHOLD = 1000
 
 
 @app.route('/api/upload', methods=['POST'])
@@ -90,37 +84,44 @@ def simplify_shape():
 
         simplified_geojsons = {algorithm: {} for algorithm in algorithms}
 
-        def simplify_task(algorithm, tolerance):
-            simplified_gdf = gdf.copy()
-
-            simplify_funcs = {
-                "Ramer-Douglas-Peucker (implementált)": lambda: traverse_geometries(gdf, tolerance, douglas_peucker),
-                "Ramer-Douglas-Peucker (beépített)": lambda: gdf.simplify(tolerance),
-                "Ramer-Douglas-Peucker (továbbfejlesztett)": lambda: traverse_geometries(gdf, tolerance, improved_douglas_peucker),
-                "Visvaligam-Whyatt": lambda: traverse_geometries(gdf, tolerance / 10, visvalingam_whyatt),
-                "Reumann-Witkam": lambda: traverse_geometries(gdf, tolerance, reumann_witkam),
-                "Merőleges távolság": lambda: traverse_geometries(gdf, tolerance / 100, pd),
-                "Sugárirányú távolság": lambda: traverse_geometries(gdf, tolerance, radial_distance),
-                "N-edik pont": lambda: traverse_geometries(gdf, math.ceil(tolerance * 10), nth_point),
-                "Lang": lambda: traverse_geometries(gdf, tolerance, lang),
-                "Véletlenszerű": lambda: traverse_geometries(gdf, tolerance, simplify_random)
-            }
+        parallel = count_vertices(gdf) >= PARALLEL_VERTEX_THRESHOLD
+
+        if parallel:
+            # Shards of every traversed pair share the process pool
+            traversal = ParallelTraversal()
+            handles = {}
+
+            for algorithm in algorithms:
+                for tolerance in tolerances:
+                    if algorithm in DIRECT_ALGORITHMS:
+                        simplified_gdf = DIRECT_ALGORITHMS[algorithm](gdf, tolerance)
+                        simplified_geojsons[algorithm][tolerance] = json.loads(simplified_gdf.to_json())
+                    else:
+                        func, scale = TRAVERSAL_ALGORITHMS[algorithm]
+                        handles[(algorithm, tolerance)] = traversal.submit(gdf, scale(tolerance), func)
+
+            traversal.run()
+
+            for (algorithm, tolerance), handle in handles.items():
+                simplified_geojsons[algorithm][tolerance] = json.loads(handle.result.to_json())
 
-            simplified_gdf = simplify_funcs[algorithm]()
+        else:
+            def simplify_task(algorithm, tolerance):
+                simplified_gdf = simplify(gdf, algorithm, tolerance)
 
-            geojson_data = simplified_gdf.to_json()
-            return algorithm, tolerance, json.loads(geojson_data)
+                geojson_data = simplified_gdf.to_json()
+                return algorithm, tolerance, json.loads(geojson_data)
 
-        with ThreadPoolExecutor() as executor:
-            tasks = [
-                executor.submit(simplify_task, algorithm, tolerance)
-                for algorithm in algorithms
-                for tolerance in tolerances
-            ]
+            with ThreadPoolExecutor() as executor:
+                tasks = [
+                    executor.submit(simplify_task, algorithm, tolerance)
+                    for algorithm in algorithms
+                    for tolerance in tolerances
+                ]
 
-            for future in tasks:
-                algorithm, tolerance, geojson_data = future.result()
-                simplified_geojsons[algorithm][tolerance] = geojson_data
+                for future in tasks:
+                    algorithm, tolerance, geojson_data = future.result()
+                    simplified_geojsons[algorithm][tolerance] = geojson_data
 
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -133,6 +134,8 @@ def simplify_shape():
             "elapsedTime": elapsed_time,
             "currentMemoryUsage": current,
             "peakMemoryUsage": peak,
+            # Worker processes are not traced, so memory figures differ when this is set
+            "parallel": parallel,
         })
 
     except Exception as e:
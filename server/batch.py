@@ -0,0 +1,228 @@
+"""Offline batch simplification"""
+import os
+import re
+import sys
+import glob
+import shutil
+import argparse
+import unicodedata
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import geopandas as gpd
+from simplification.registry import ALGORITHM_NAMES, DIRECT_ALGORITHMS, simplify
+
+BATCH_SIZE = 10000
+
+
+def positive_int(value) -> int:
+    """Argparse type for strictly positive integers"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def input_root(pattern) -> str:
+    """Directory that layer names of an input are relative to"""
+    if os.path.isdir(pattern):
+        return pattern
+
+    parts = []
+    for part in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+
+    return os.sep.join(parts) or os.curdir
+
+
+def find_layers(inputs, exclude) -> list:
+    """Collect (path, zip member, name) layers, named by their path relative to their input"""
+    paths = {}
+
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, '**', '*.shp'), recursive=True)
+            matches += glob.glob(os.path.join(pattern, '**', '*.zip'), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+
+        root = input_root(pattern)
+        for path in matches:
+            # Never read back outputs of earlier runs written inside an input directory
+            if not path.endswith(('.shp', '.zip')) or os.path.commonpath([os.path.abspath(path), exclude]) == exclude:
+                continue
+
+            paths.setdefault(os.path.abspath(path), (path, os.path.relpath(path, root)))
+
+    layers = []
+    for path, relative in sorted(paths.values()):
+        if not path.endswith('.zip'):
+            layers.append((path, None, os.path.splitext(relative)[0]))
+            continue
+
+        with zipfile.ZipFile(path, 'r') as zip_ref:
+            members = sorted(f for f in zip_ref.namelist() if f.endswith('.shp'))
+
+        if not members:
+            print(f"{path}: no .shp file, skipped", file=sys.stderr)
+
+        # A zip is mirrored like a directory, one layer per shapefile inside it
+        layers.extend(
+            (path, member, os.path.join(relative, os.path.splitext(member)[0]))
+            for member in members
+        )
+
+    return layers
+
+
+def slugify(text) -> str:
+    """Turn an algorithm name into a file name friendly form"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^0-9A-Za-z]+', '-', text).strip('-').lower()
+
+
+def output_name(algorithm, tolerance) -> str:
+    """Name of the output shapefile of an algorithm-tolerance pair"""
+    return f"{slugify(algorithm)}_{tolerance!r}"
+
+
+def output_files(directory, name) -> list:
+    """Files of one output shapefile, with the .shp last"""
+    files = [f for f in os.listdir(directory) if f.startswith(name + '.')]
+    return sorted(files, key=lambda f: f == name + '.shp')
+
+
+def read_batches(shp_file, batch_size):
+    """Stream the features of a shapefile in batches"""
+    start = 0
+
+    while True:
+        batch = gpd.read_file(shp_file, rows=slice(start, start + batch_size))
+        if batch.empty:
+            return
+
+        yield batch
+
+        # A short batch is the last one, no need to open the file again
+        if len(batch) < batch_size:
+            return
+
+        start += batch_size
+
+
+def simplify_layer(layer, output, pairs, batch_size, force):
+    """Simplify one layer with every algorithm-tolerance pair"""
+    path, member, layer_name = layer
+    layer_dir = os.path.join(output, layer_name)
+    os.makedirs(layer_dir, exist_ok=True)
+
+    # Finished outputs are skipped, so an interrupted run picks up where it stopped
+    pending = [
+        (algorithm, tolerance)
+        for algorithm, tolerance in pairs
+        if force or not os.path.isfile(os.path.join(layer_dir, output_name(algorithm, tolerance) + '.shp'))
+    ]
+
+    if not pending:
+        return layer_name, 0
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        shp_file = path
+
+        if member is not None:
+            stem = os.path.splitext(member)[0]
+
+            with zipfile.ZipFile(path, 'r') as zip_ref:
+                zip_ref.extractall(tmpdirname, [f for f in zip_ref.namelist() if os.path.splitext(f)[0] == stem])
+
+            shp_file = os.path.join(tmpdirname, member)
+
+        partial_dir = os.path.join(layer_dir, '.partial')
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        os.makedirs(partial_dir)
+
+        written = set()
+        for batch in read_batches(shp_file, batch_size):
+            for algorithm, tolerance in pending:
+                simplified = simplify(batch, algorithm, tolerance)
+
+                if algorithm in DIRECT_ALGORITHMS:
+                    simplified = batch.set_geometry(simplified)
+
+                name = output_name(algorithm, tolerance)
+                simplified.to_file(os.path.join(partial_dir, name + '.shp'), driver="ESRI Shapefile",
+                                   mode='a' if name in written else 'w')
+                written.add(name)
+
+        for name in written:
+            # Drop the previous output, .shp first, so a half-replaced set never looks complete
+            for filename in reversed(output_files(layer_dir, name)):
+                os.remove(os.path.join(layer_dir, filename))
+
+            # Move the .shp last, its presence marks the output as complete
+            for filename in output_files(partial_dir, name):
+                os.replace(os.path.join(partial_dir, filename), os.path.join(layer_dir, filename))
+
+        shutil.rmtree(partial_dir, ignore_errors=True)
+
+    return layer_name, len(written)
+
+
+def main(argv=None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Simplify shapefile layers without the web server.")
+    parser.add_argument('inputs', nargs='+', help="directories, shapefiles, zip files or glob patterns")
+    parser.add_argument('-o', '--output', required=True, help="output directory")
+    parser.add_argument('-a', '--algorithms', nargs='+', required=True, choices=ALGORITHM_NAMES,
+                        metavar='ALGORITHM', help="algorithm names: " + ", ".join(ALGORITHM_NAMES))
+    parser.add_argument('-t', '--tolerances', nargs='+', required=True, type=float, help="tolerance values")
+    parser.add_argument('-w', '--workers', type=positive_int, default=os.cpu_count() or 1, help="parallel layer workers")
+    parser.add_argument('-b', '--batch-size', type=positive_int, default=BATCH_SIZE, help="features read per batch")
+    parser.add_argument('-f', '--force', action='store_true', help="recompute outputs that already exist")
+    args = parser.parse_args(argv)
+
+    pairs = list(dict.fromkeys(
+        (algorithm, tolerance)
+        for algorithm in args.algorithms
+        for tolerance in args.tolerances
+    ))
+
+    names = [output_name(algorithm, tolerance) for algorithm, tolerance in pairs]
+    collisions = sorted({name for name in names if names.count(name) > 1})
+    if collisions:
+        print(f"Output names must be unique: {', '.join(collisions)}", file=sys.stderr)
+        return 1
+
+    layers = find_layers(args.inputs, os.path.abspath(args.output))
+    if not layers:
+        print("No shapefiles or zip files found.", file=sys.stderr)
+        return 1
+
+    layer_names = [name for _, _, name in layers]
+    duplicates = sorted({name for name in layer_names if layer_names.count(name) > 1})
+    if duplicates:
+        print(f"Inputs map to the same output layer: {', '.join(duplicates)}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        tasks = {
+            executor.submit(simplify_layer, layer, args.output, pairs, args.batch_size, args.force): layer[2]
+            for layer in layers
+        }
+
+        for future in as_completed(tasks):
+            try:
+                layer_name, written = future.result()
+                print(f"{layer_name}: {written} output(s) written")
+            except Exception as e:
+                failed += 1
+                print(f"{tasks[future]}: {e}", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Check that sharded Douglas-Peucker matches the serial algorithm"""
+import sys
+import geopandas as gpd
+from simplification.utils import geometry_rings, traverse_geometries
+from simplification.douglas import douglas_peucker, split_douglas_peucker
+from simplification.scheduler import ParallelTraversal
+
+TOLERANCES = [0.001, 0.01, 0.1]
+SEGMENT_COUNTS = [2, 4, 16]
+
+# Enough chunks that the largest rings are cut into shards
+CHUNKS = 32
+
+
+def sharded_douglas_peucker(coords, tolerance, max_segments):
+    """Split, simplify every segment on its own and rejoin at the shared endpoints"""
+    ring = []
+
+    for segment in split_douglas_peucker(coords, tolerance, max_segments):
+        ring = ring[:-1] + douglas_peucker(segment, tolerance)
+
+    return ring
+
+
+def main(path) -> int:
+    """Compare serial and sharded results on every ring of a layer"""
+    gdf = gpd.read_file(path)
+    rings = [coords for geom in gdf.geometry for coords in geometry_rings(geom)]
+    mismatches = 0
+
+    for tolerance in TOLERANCES:
+        for max_segments in SEGMENT_COUNTS:
+            for coords in rings:
+                if sharded_douglas_peucker(coords, tolerance, max_segments) != douglas_peucker(coords, tolerance):
+                    mismatches += 1
+
+        # The same comparison end to end, through the shared process pool
+        traversal = ParallelTraversal(CHUNKS)
+        handle = traversal.submit(gdf, tolerance, douglas_peucker)
+        traversal.run()
+
+        serial = traverse_geometries(gdf, tolerance, douglas_peucker)
+        for geom, parallel_geom in zip(serial.geometry, handle.result.geometry):
+            if (geom is None) != (parallel_geom is None):
+                mismatches += 1
+            elif geom is not None and not geom.equals_exact(parallel_geom, 0):
+                mismatches += 1
+
+    print(f"{path}: {len(rings)} rings, {mismatches} mismatch(es)")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else "samples/hungary.zip"))
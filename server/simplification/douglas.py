@@ -3,11 +3,8 @@ from simplification.utils import perpendicular_distance
 import numpy as np
 
 
-def douglas_peucker(coords, tolerance):
-    """Douglas-Peucker algorithm"""
-    if len(coords) < 3:
-        return coords
-
+def farthest_point(coords):
+    """Find the point farthest from the line between the endpoints"""
     start = coords[0]
     end = coords[-1]
     max_distance = 0
@@ -19,10 +16,45 @@ def douglas_peucker(coords, tolerance):
             max_distance = distance
             index = i
 
+    return index, max_distance
+
+
+def douglas_peucker(coords, tolerance):
+    """Douglas-Peucker algorithm"""
+    if len(coords) < 3:
+        return coords
+
+    index, max_distance = farthest_point(coords)
+
     if max_distance > tolerance:
         left = douglas_peucker(coords[:index + 1], tolerance)
         right = douglas_peucker(coords[index:], tolerance)
 
         return left[:-1] + right
 
-    return [start, end]
+    return [coords[0], coords[-1]]
+
+
+def split_douglas_peucker(coords, tolerance, max_segments):
+    """Split coordinates at the top-level Douglas-Peucker splits"""
+    # Neighbouring segments share their endpoint, exactly like the recursion
+    segments = [coords]
+    final = set()
+
+    while len(segments) < max_segments:
+        candidates = [i for i in range(len(segments)) if i not in final and len(segments[i]) >= 3]
+        if not candidates:
+            break
+
+        largest = max(candidates, key=lambda i: len(segments[i]))
+        segment = segments[largest]
+        index, max_distance = farthest_point(segment)
+
+        if max_distance <= tolerance:
+            final.add(largest)
+            continue
+
+        segments[largest:largest + 1] = [segment[:index + 1], segment[index:]]
+        final = {i if i < largest else i + 1 for i in final}
+
+    return segments
@@ -0,0 +1,41 @@
+"""Simplification algorithm registry"""
+import math
+from simplification.utils import traverse_geometries
+from simplification.douglas import douglas_peucker
+from simplification.douglas_improved import improved_douglas_peucker
+from simplification.visvalingam import visvalingam_whyatt
+from simplification.reumann import reumann_witkam
+from simplification.perpendicular_distance import pd
+from simplification.radial_distance import radial_distance
+from simplification.nth_point import nth_point
+from simplification.lang import lang
+from simplification.random import simplify_random
+
+# Algorithms run ring by ring through traverse_geometries, with their tolerance scaling
+TRAVERSAL_ALGORITHMS = {
+    "Ramer-Douglas-Peucker (implementált)": (douglas_peucker, lambda tolerance: tolerance),
+    "Ramer-Douglas-Peucker (továbbfejlesztett)": (improved_douglas_peucker, lambda tolerance: tolerance),
+    "Visvaligam-Whyatt": (visvalingam_whyatt, lambda tolerance: tolerance / 10),
+    "Reumann-Witkam": (reumann_witkam, lambda tolerance: tolerance),
+    "Merőleges távolság": (pd, lambda tolerance: tolerance / 100),
+    "Sugárirányú távolság": (radial_distance, lambda tolerance: tolerance),
+    "N-edik pont": (nth_point, lambda tolerance: math.ceil(tolerance * 10)),
+    "Lang": (lang, lambda tolerance: tolerance),
+    "Véletlenszerű": (simplify_random, lambda tolerance: tolerance)
+}
+
+# Algorithms that simplify the whole GeoDataFrame at once
+DIRECT_ALGORITHMS = {
+    "Ramer-Douglas-Peucker (beépített)": lambda gdf, tolerance: gdf.simplify(tolerance)
+}
+
+ALGORITHM_NAMES = list(TRAVERSAL_ALGORITHMS) + list(DIRECT_ALGORITHMS)
+
+
+def simplify(gdf, algorithm, tolerance):
+    """Run a registered algorithm on a GeoDataFrame"""
+    if algorithm in DIRECT_ALGORITHMS:
+        return DIRECT_ALGORITHMS[algorithm](gdf, tolerance)
+
+    func, scale = TRAVERSAL_ALGORITHMS[algorithm]
+    return traverse_geometries(gdf, scale(tolerance), func)
@@ -0,0 +1,145 @@
+"""Size-aware parallel traversal"""
+import os
+import heapq
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from simplification.utils import geometry_rings, assemble_geometry, traverse_geometries
+from simplification.douglas import douglas_peucker, split_douglas_peucker
+from simplification.nth_point import nth_point
+from simplification.random import simplify_random
+
+# Algorithms whose single ring can be cut into independently simplified shards
+SPLITTERS = {
+    douglas_peucker: split_douglas_peucker,
+}
+
+# Algorithms cheaper than shipping their rings to a worker and back, run in the caller instead
+INLINE_ALGORITHMS = {nth_point, simplify_random}
+
+# Upper bound on worker processes shared by every request
+MAX_WORKERS = min(os.cpu_count() or 1, 8)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Shared process pool, created on first use and reused across requests"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers do not inherit the threads of the calling process
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+
+        return _pool
+
+
+def simplify_chunk(chunk):
+    """Simplify every shard of a chunk"""
+    return [(key, list(algorithm(coords, tolerance))) for key, algorithm, tolerance, coords in chunk]
+
+
+def balance_chunks(shards, chunk_count):
+    """Distribute shards into chunks of roughly equal vertex count"""
+    chunks = [[] for _ in range(chunk_count)]
+    loads = [(0, i) for i in range(chunk_count)]
+
+    # Longest processing time first: always feed the lightest chunk
+    for shard in sorted(shards, key=lambda shard: len(shard[3]), reverse=True):
+        load, i = heapq.heappop(loads)
+        chunks[i].append(shard)
+        heapq.heappush(loads, (load + len(shard[3]), i))
+
+    return [chunk for chunk in chunks if chunk]
+
+
+class TraversalHandle:
+    """Result slot of a queued traversal, filled in by ParallelTraversal.run"""
+
+    def __init__(self):
+        self.result = None
+
+
+class ParallelTraversal:
+    """Collects traversals and runs all of their rings in the shared process pool"""
+
+    def __init__(self, chunks=MAX_WORKERS):
+        self.chunks = chunks
+        self.jobs = []
+
+    def submit(self, gdf, tolerance, algorithm) -> TraversalHandle:
+        """Queue a traversal, same signature as traverse_geometries"""
+        handle = TraversalHandle()
+
+        if algorithm in INLINE_ALGORITHMS:
+            handle.result = traverse_geometries(gdf, tolerance, algorithm)
+        else:
+            self.jobs.append((gdf, tolerance, algorithm, handle))
+
+        return handle
+
+    def run(self):
+        """Simplify every queued traversal and fill in their handles"""
+        if not self.jobs:
+            return
+
+        # Jobs usually share one GeoDataFrame, so extract its rings only once
+        rings_by_gdf = {}
+        for gdf, _, _, _ in self.jobs:
+            if id(gdf) not in rings_by_gdf:
+                rings_by_gdf[id(gdf)] = [geometry_rings(geom) for geom in gdf.geometry]
+
+        total_vertices = sum(
+            len(coords)
+            for gdf, _, _, _ in self.jobs
+            for rings in rings_by_gdf[id(gdf)]
+            for coords in rings
+        )
+        shard_size = max(3, -(-total_vertices // self.chunks))
+
+        shards = []
+        for job_idx, (gdf, tolerance, algorithm, _) in enumerate(self.jobs):
+            splitter = SPLITTERS.get(algorithm)
+
+            for geom_idx, rings in enumerate(rings_by_gdf[id(gdf)]):
+                for ring_idx, coords in enumerate(rings):
+                    segments = [coords]
+
+                    if splitter is not None and len(coords) > shard_size:
+                        segments = splitter(coords, tolerance, -(-len(coords) // shard_size))
+
+                    for segment_idx, segment in enumerate(segments):
+                        shards.append(((job_idx, geom_idx, ring_idx, segment_idx), algorithm, tolerance, segment))
+
+        simplified_segments = {}
+
+        executor = get_pool()
+        tasks = [executor.submit(simplify_chunk, chunk) for chunk in balance_chunks(shards, self.chunks)]
+
+        for future in tasks:
+            simplified_segments.update(future.result())
+
+        for job_idx, (gdf, _, _, handle) in enumerate(self.jobs):
+            simplified_geometries = []
+
+            for geom_idx, (geom, rings) in enumerate(zip(gdf.geometry, rings_by_gdf[id(gdf)])):
+                simplified_rings = []
+
+                for ring_idx in range(len(rings)):
+                    ring = []
+                    segment_idx = 0
+
+                    while (job_idx, geom_idx, ring_idx, segment_idx) in simplified_segments:
+                        # Shards share their endpoints, so drop the duplicate joint
+                        ring = ring[:-1] + simplified_segments[(job_idx, geom_idx, ring_idx, segment_idx)]
+                        segment_idx += 1
+
+                    simplified_rings.append(ring)
+
+                simplified_geometries.append(assemble_geometry(geom, simplified_rings))
+
+            gdf_simplified = gdf.copy()
+            gdf_simplified['geometry'] = simplified_geometries
+            handle.result = gdf_simplified
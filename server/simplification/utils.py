@@ -48,58 +48,73 @@ def calculate_angle(p1, p2, p3) -> np.ndarray:
     return np.arccos(np.clip(cos_angle, -1.0, 1.0))
 
 
-def traverse_geometries(gdf, tolerance, algorithm):
-    """Traverse geometries in GeoDataFrame"""
-    simplified_geometries = []
+def geometry_rings(geom) -> list:
+    """Collect the coordinate sequences of a geometry in traversal order"""
+    if geom is None or geom.is_empty:
+        return []
 
-    for geom in gdf.geometry:
-        if geom.geom_type == 'LineString':
-            coords = list(geom.coords)
-            simplified_coords = algorithm(coords, tolerance)
-            simplified_geometries.append(LineString(simplified_coords))
+    if geom.geom_type == 'LineString':
+        return [list(geom.coords)]
 
-        elif geom.geom_type == 'Polygon':
-            exterior_coords = list(geom.exterior.coords)
-            simplified_exterior = algorithm(exterior_coords, tolerance)
+    if geom.geom_type == 'Polygon':
+        return [list(geom.exterior.coords)] + [list(interior.coords) for interior in geom.interiors]
 
-            if len(simplified_exterior) < 4:
-                simplified_geometries.append(None)
-                continue
+    if geom.geom_type == 'MultiPolygon':
+        rings = []
+        for polygon in geom.geoms:
+            rings.append(list(polygon.exterior.coords))
+            rings.extend(list(interior.coords) for interior in polygon.interiors)
+        return rings
 
-            simplified_interiors = []
-            for interior in geom.interiors:
-                interior_coords = list(interior.coords)
-                simplified_interior = algorithm(interior_coords, tolerance)
-                if len(simplified_interior) > 2:
-                    simplified_interiors.append(LineString(simplified_interior))
+    return []
 
-            simplified_geometries.append(Polygon(simplified_exterior, simplified_interiors))
 
-        elif geom.geom_type == 'MultiPolygon':
-            simplified_polys = []
-            for polygon in geom.geoms:
-                exterior_coords = list(polygon.exterior.coords)
-                simplified_exterior = algorithm(exterior_coords, tolerance)
+def assemble_geometry(geom, simplified_rings):
+    """Rebuild a geometry from its simplified coordinate sequences"""
+    if geom is None or geom.is_empty:
+        return geom
 
-                if len(simplified_exterior) < 4:
-                    continue
+    if geom.geom_type == 'LineString':
+        return LineString(simplified_rings[0])
 
-                simplified_interiors = []
-                for interior in polygon.interiors:
-                    interior_coords = list(interior.coords)
-                    simplified_interior = algorithm(interior_coords, tolerance)
-                    if len(simplified_interior) > 2:
-                        simplified_interiors.append(LineString(simplified_interior))
+    if geom.geom_type == 'Polygon':
+        polygons = [(simplified_rings[0], simplified_rings[1:])]
+
+    elif geom.geom_type == 'MultiPolygon':
+        polygons = []
+        offset = 0
+        for polygon in geom.geoms:
+            ring_count = 1 + len(polygon.interiors)
+            polygons.append((simplified_rings[offset], simplified_rings[offset + 1:offset + ring_count]))
+            offset += ring_count
+
+    else:
+        return geom
+
+    simplified_polys = []
+    for simplified_exterior, simplified_interiors in polygons:
+        if len(simplified_exterior) < 4:
+            continue
 
-                simplified_polys.append(Polygon(simplified_exterior, simplified_interiors))
+        holes = [LineString(interior) for interior in simplified_interiors if len(interior) > 2]
+        simplified_polys.append(Polygon(simplified_exterior, holes))
 
-            if simplified_polys:
-                simplified_geometries.append(MultiPolygon(simplified_polys))
-            else:
-                simplified_geometries.append(None)
+    if not simplified_polys:
+        return None
 
-        else:
-            simplified_geometries.append(geom)
+    if geom.geom_type == 'Polygon':
+        return simplified_polys[0]
+
+    return MultiPolygon(simplified_polys)
+
+
+def traverse_geometries(gdf, tolerance, algorithm):
+    """Traverse geometries in GeoDataFrame"""
+    simplified_geometries = []
+
+    for geom in gdf.geometry:
+        simplified_rings = [algorithm(coords, tolerance) for coords in geometry_rings(geom)]
+        simplified_geometries.append(assemble_geometry(geom, simplified_rings))
 
     gdf_simplified = gdf.copy()
     gdf_simplified['geometry'] = simplified_geometries